@@ -1,5 +1,61 @@
 import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+import aiohttp
+from cachetools import TTLCache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .factories.strategy_factory import PixabayFactory, UnsplashFactory, PexelsFactory
+from .strategies.strategy import _MAX_RETRY_AFTER
+
+_FACTORIES = {
+    'pixabay': PixabayFactory,
+    'unsplash': UnsplashFactory,
+    'pexels': PexelsFactory,
+}
+
+_CONTENT_TYPES = ('image', 'video')
+
+logger = logging.getLogger(__name__)
+
+# Clients created by `SearchClient.from_env`, by provider, so their sessions and caches are reused.
+_CLIENTS = {}
+
+class _CappedRetry(Retry):
+    """
+    A urllib3 Retry that reads Retry-After the way `asearch` does.
+
+    Fractional seconds are accepted, and the wait is capped at `_MAX_RETRY_AFTER` so a rate-limited
+    synchronous search never blocks longer than the asynchronous one would.
+    """
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            # HTTP dates are left to urllib3.
+            seconds = super().parse_retry_after(retry_after)
+        return min(max(seconds, 0), _MAX_RETRY_AFTER)
+
+
+def _cache_key(content_type: str, params: dict) -> tuple:
+    """
+    Build a deterministic cache key for a search request.
+
+    Args:
+        content_type (str): The type of content searched for ('image', 'video').
+        params (dict): The search parameters.
+
+    Returns:
+        tuple: A key that is independent of the order of `params`. It is unhashable if a parameter
+            value is (e.g. a list); see `SearchClient._cache_lookup`.
+    """
+    return (content_type, *sorted(params.items()))
+
 
 class SearchClient:
     """
@@ -9,27 +65,346 @@ class SearchClient:
         params (dict): A dictionary containing the provider and API key.
             - provider (str): The provider name ('pixabay', 'unsplash', 'pexels').
             - key (str): The API key for the provider.
+            - cache_ttl (float, optional): Seconds a search response is fresh for (default 300).
+            - cache_stale_ttl (float, optional): Seconds past `cache_ttl` that `asearch` still returns a
+              cached response while refreshing it in the background (default 60).
+            - cache_size (int, optional): Maximum number of cached responses (default 1024).
+            - max_inflight (int, optional): Maximum number of concurrent asynchronous requests (default 20).
+
+    Raises:
+        ValueError: If an unknown provider is given.
 
     Attributes:
         _api_key (str): The API key for the provider.
-        _image_searcher (SearchStrategy): The search strategy for image content.
-        _video_searcher (SearchStrategy): The search strategy for video content.
+        _provider (str): The provider name.
+        _factory (type): The provider's strategy factory.
+        _searchers (dict): The search strategies by content type ('image', 'video'), built on first use.
+        _session (aiohttp.ClientSession): The session shared by all asynchronous searches,
+            created on the first call to `asearch`.
+        _loop (asyncio.AbstractEventLoop): The event loop the session, semaphore and in-flight futures belong to.
+        _sync_session (requests.Session): The pooled session shared by all synchronous searches.
+        _cache (TTLCache): Recent search responses, keyed by content type and parameters. Each entry is a
+            dict with the 'value', the monotonic time it was 'cached_at' and whether it is 'refreshing'.
+        _cache_ttl (float): Seconds a cached response is served without refreshing it.
+        _refresh_tasks (set): Background tasks refreshing stale cache entries.
+        _inflight (dict): Futures of the asynchronous searches currently running, by cache key.
+        _max_inflight (int): The maximum number of asynchronous requests in flight.
+        _semaphore (asyncio.Semaphore): Enforces `_max_inflight`, created once per event loop.
+        _closed (bool): Whether `aclose` was called; no new session is created on the same event loop after it.
+
+    A client is meant to be long-lived: its connection pools and response cache only pay off when it is
+    reused across searches. Use it as an async context manager so the shared session is closed on exit:
+
+        async with SearchClient(params) as client:
+            images = await client.asearch({'query': 'cat'}, 'image')
+
+    or get a process-wide client per provider with `SearchClient.from_env(provider)`. A client used from a
+    new event loop rebuilds its loop-bound state; call `aclose()` before a loop ends to close the session cleanly.
     """
+    __slots__ = (
+        '_api_key', '_provider', '_factory', '_searchers',
+        '_session', '_loop', '_sync_session', '_cache', '_cache_ttl', '_cache_lock', '_refresh_tasks', '_inflight',
+        '_max_inflight', '_semaphore', '_closed',
+    )
 
     def __init__(self, params: dict) -> None:
         provider = params.get('provider')
         api_key = params.get('key')
+        factory = _FACTORIES.get(provider)
+        if factory is None:
+            raise ValueError('Invalid provider')
 
         self._api_key = api_key
-        if provider == 'pixabay':
-            self._image_searcher = PixabayFactory.get_search_strategy(api_key, 'image')
-            self._video_searcher = PixabayFactory.get_search_strategy(api_key, 'video')
-        elif provider == 'unsplash':
-            self._image_searcher = UnsplashFactory.get_search_strategy(api_key, 'image')
-            self._video_searcher = UnsplashFactory.get_search_strategy(api_key, 'video')
-        elif provider == 'pexels':
-            self._image_searcher = PexelsFactory.get_search_strategy(api_key, 'image')
-            self._video_searcher = PexelsFactory.get_search_strategy(api_key, 'video')
+        self._provider = provider
+        self._cache_ttl = params.get('cache_ttl', 300)
+        # Entries are kept for the stale window too; freshness is checked against `_cache_ttl` on read.
+        self._cache = TTLCache(
+            maxsize=params.get('cache_size', 1024),
+            ttl=self._cache_ttl + params.get('cache_stale_ttl', 60),
+            timer=time.monotonic,
+        )
+        self._cache_lock = threading.Lock()
+        self._refresh_tasks = set()
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # Matches the connector's limit_per_host, since every request of a client goes to the same host.
+        self._max_inflight = params.get('max_inflight', 20)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closed = False
+        self._sync_session = self._build_sync_session()
+        self._factory = factory
+        self._searchers = {}
+
+    @classmethod
+    def from_env(cls, provider: str) -> 'SearchClient':
+        """
+        Return the shared client for a provider, reading its API key from the environment.
+
+        The key is read from the `<PROVIDER>_KEY` variable (e.g. `PIXABAY_KEY`) on first use, and the same
+        client is returned on every later call. Leaving an `async with` or `with` block does not close a shared
+        client, since other callers may still be using it; call `aclose()` and `close()` explicitly instead.
+
+        Args:
+            provider (str): The provider name ('pixabay', 'unsplash', 'pexels').
+
+        Returns:
+            SearchClient: The shared client for the provider.
+
+        Raises:
+            ValueError: If an unknown provider is given.
+        """
+        if provider not in _FACTORIES:
+            raise ValueError('Invalid provider')
+        client = _CLIENTS.get(provider)
+        if client is None:
+            client = cls({'provider': provider, 'key': os.getenv(f'{provider.upper()}_KEY')})
+            _CLIENTS[provider] = client
+        return client
+
+    def _get_searcher(self, content_type: str):
+        """
+        Return the search strategy for a content type, fetching it from the factory on first use.
+
+        Args:
+            content_type (str): The type of content to search for ('image', 'video').
+
+        Returns:
+            SearchStrategy: The search strategy, or None if the content type has none.
+        """
+        searcher = self._searchers.get(content_type)
+        if searcher is None and content_type in _CONTENT_TYPES:
+            searcher = self._factory.get_search_strategy(self._api_key, content_type)
+            self._searchers[content_type] = searcher
+        return searcher
+
+    @property
+    def _image_searcher(self):
+        return self._get_searcher('image')
+
+    @property
+    def _video_searcher(self):
+        return self._get_searcher('video')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if not self._is_shared():
+            await self.aclose()
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._is_shared():
+            self.close()
+
+    def _is_shared(self) -> bool:
+        # Clients handed out by `from_env` are closed explicitly, not by whichever caller exits first.
+        return _CLIENTS.get(self._provider) is self
+
+    @staticmethod
+    def _build_sync_session() -> requests.Session:
+        """
+        Build a requests session with a pooled, retrying adapter for synchronous searches.
+        """
+        retries = _CappedRetry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            # Hand the last error response back so the strategy logs its status instead of a RetryError.
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retries)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    async def _check_loop(self) -> None:
+        """
+        Reset the state bound to a previous event loop when the client is used from a new one.
+
+        Shared clients (see `from_env`) can outlive an `asyncio.run` call. A session the old loop left open is
+        closed, and the semaphore, in-flight futures and refreshes are reset. If the old loop has already been
+        closed, its pooled connections can no longer be shut down cleanly, which is logged as a warning.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        old_loop, session = self._loop, self._session
+        # Reset before awaiting, so searches started meanwhile on this loop see the new state.
+        self._loop = loop
+        self._session = None
+        self._semaphore = asyncio.Semaphore(self._max_inflight)
+        self._inflight = {}
+        self._refresh_tasks = set()
+        self._closed = False
+        if session is not None and not session.closed:
+            if old_loop.is_closed():
+                logger.warning("Session left open by a closed event loop; call aclose() before the loop ends")
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning("Failed to close the previous event loop's session: %s", e)
+
+    @staticmethod
+    def _build_resolver():
+        """
+        Return an aiodns-backed resolver, or the default threaded one if aiodns is unavailable.
+
+        aiodns may be missing, or refuse to start (e.g. on Windows' Proactor event loop or without a usable
+        resolv.conf); searches should still work in that case.
+        """
+        try:
+            return aiohttp.AsyncResolver()
+        except Exception as e:
+            logger.debug("Falling back to the threaded DNS resolver: %s", e)
+            return aiohttp.ThreadedResolver()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session, creating it on first use.
+
+        The session is bound to the running event loop, so it cannot be built in `__init__`.
+
+        Raises:
+            RuntimeError: If the client was closed with `aclose` on this event loop.
+        """
+        if self._closed:
+            raise RuntimeError('SearchClient is closed')
+        if self._session is None or self._session.closed:
+            # aiodns resolves without the thread pool; IPv4 only skips the extra AAAA lookup per host.
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                resolver=self._build_resolver(),
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                family=socket.AF_INET,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self) -> None:
+        """
+        Cancel pending cache refreshes, wait for them to finish and close the shared aiohttp session.
+
+        Searches that still need a request on this event loop raise RuntimeError afterwards, rather than
+        opening a session nobody closes; the client can be used again from a new event loop.
+        """
+        await self._check_loop()
+        self._closed = True
+        tasks = list(self._refresh_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def close(self) -> None:
+        """
+        Close the pooled session used by synchronous searches.
+        """
+        self._sync_session.close()
+
+    def _cache_get(self, key: tuple):
+        with self._cache_lock:
+            return self._cache.get(key)
+
+    def _cache_lookup(self, content_type: str, params: dict):
+        """
+        Return the cache key for a search and its cached entry, or None if there is none.
+        """
+        key = _cache_key(content_type, params)
+        try:
+            return key, self._cache_get(key)
+        except TypeError:
+            # Unhashable parameter values (e.g. lists) fall back to a repr-based key.
+            key = (content_type, repr(key[1:]))
+            return key, self._cache_get(key)
+
+    def _cache_set(self, key: tuple, result) -> None:
+        # Failed searches return None and are not cached, so they are retried on the next call.
+        if result is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = {'value': result, 'cached_at': time.monotonic(), 'refreshing': False}
+
+    def _is_fresh(self, entry: dict) -> bool:
+        return time.monotonic() - entry['cached_at'] <= self._cache_ttl
+
+    async def _afetch(self, searcher, params: dict, key: tuple):
+        # Concurrent identical searches wait on the request already in flight instead of issuing their own.
+        future = self._inflight.get(key)
+        while future is not None:
+            try:
+                # Shielded so a cancelled waiter does not cancel the shared future for everyone else.
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The call that owned the request was cancelled, not this one; fetch again.
+                future = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await searcher.asearch(params, session=self._get_session(), semaphore=self._semaphore)
+            self._cache_set(key, result)
+            if not future.done():
+                future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # Waiters see the cancelled future and retry rather than receiving this call's cancellation.
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                # Re-raised below; mark it retrieved so a future nobody awaited does not log a warning.
+                future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _refresh(self, searcher, params: dict, key: tuple, entry: dict) -> None:
+        try:
+            await self._afetch(searcher, params, key)
+        except Exception as e:
+            logger.warning("Cache refresh failed: %s", e)
+        finally:
+            # A successful refresh replaces the entry; a failed one lets the next stale hit try again.
+            entry['refreshing'] = False
+
+    async def _asearch_cached(self, searcher, params: dict, content_type: str):
+        await self._check_loop()
+        key, entry = self._cache_lookup(content_type, params)
+        if entry is None:
+            return await self._afetch(searcher, params, key)
+
+        # Stale-while-revalidate: past its TTL the entry is still returned, while one background task refreshes it.
+        if not self._is_fresh(entry) and not entry['refreshing']:
+            entry['refreshing'] = True
+            task = asyncio.create_task(self._refresh(searcher, params, key, entry))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        return entry['value']
+
+    def _search_cached(self, searcher, params: dict, content_type: str):
+        # Without an event loop to refresh in the background, stale entries are refetched synchronously.
+        key, entry = self._cache_lookup(content_type, params)
+        if entry is not None and self._is_fresh(entry):
+            return entry['value']
+        result = searcher.search(params, session=self._sync_session)
+        self._cache_set(key, result)
+        return result
 
     async def asearch(self, params: dict, content_type: str):
         """
@@ -48,18 +423,37 @@ class SearchClient:
         Raises:
             ValueError: If an invalid content_type is provided.
         """
-        if content_type == 'image':
-            return await self._image_searcher.asearch(params)
-        elif content_type == 'video':
-            return await self._video_searcher.asearch(params)
+        searcher = self._get_searcher(content_type)
+        if searcher is not None:
+            return await self._asearch_cached(searcher, params, content_type)
         elif content_type == 'hybrid':
-            image_task = asyncio.create_task(self.asearch(params, 'image'))
-            video_task = asyncio.create_task(self.asearch(params, 'video'))
-            images, videos = await asyncio.gather(image_task, video_task)
+            images, videos = await asyncio.gather(
+                self._asearch_cached(self._image_searcher, params, 'image'),
+                self._asearch_cached(self._video_searcher, params, 'video'),
+            )
             return {'images': images, 'videos': videos}
         else:
             raise ValueError('Invalid content type')
 
+    async def asearch_many(self, queries: list, content_type: str) -> list:
+        """
+        Asynchronously search for several queries at once.
+
+        The searches run concurrently, bounded by the client's `max_inflight` limit, and share the cache
+        and in-flight coalescing of `asearch`.
+
+        Args:
+            queries (list): The search parameter dictionaries, one per search.
+            content_type (str): The type of content to search for ('image', 'video', 'hybrid').
+
+        Returns:
+            list: The search results, in the same order as `queries`.
+
+        Raises:
+            ValueError: If an invalid content_type is provided.
+        """
+        return list(await asyncio.gather(*(self.asearch(params, content_type) for params in queries)))
+
     def search(self, params: dict, content_type: str):
         """
         Synchronously search for media content.
@@ -77,13 +471,12 @@ class SearchClient:
         Raises:
             ValueError: If an invalid content_type is provided.
         """
-        if content_type == 'image':
-            return self._image_searcher.search(params)
-        elif content_type == 'video':
-            return self._video_searcher.search(params)
+        searcher = self._get_searcher(content_type)
+        if searcher is not None:
+            return self._search_cached(searcher, params, content_type)
         elif content_type == 'hybrid':
-            images = self.search(params, 'image')
-            videos = self.search(params, 'video')
+            images = self._search_cached(self._image_searcher, params, 'image')
+            videos = self._search_cached(self._video_searcher, params, 'video')
             return {'images': images, 'videos': videos}
         else:
             raise ValueError('Invalid content type')
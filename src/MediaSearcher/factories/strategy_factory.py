@@ -7,6 +7,7 @@ from ..strategies import (
     PexelsVideoSearchStrategy,
 )
 from abc import ABC, abstractmethod
+import functools
 
 class MediaServiceFactory(ABC):
     @abstractmethod
@@ -16,9 +17,12 @@ class MediaServiceFactory(ABC):
 
 class PixabayFactory:
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_search_strategy(api_key: str, content_type: str):
         """
-        Returns the appropriate search strategy for Pixabay based on the content type.
+        Returns the shared search strategy for Pixabay based on the content type.
+
+        Strategies are stateless, so one instance is built and reused per (api_key, content_type).
 
         Args:
             api_key (str): The API key for Pixabay.
@@ -40,9 +44,12 @@ class PixabayFactory:
 
 class UnsplashFactory:
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_search_strategy(api_key: str, content_type: str):
         """
-        Returns the appropriate search strategy for Unsplash based on the content type.
+        Returns the shared search strategy for Unsplash based on the content type.
+
+        Strategies are stateless, so one instance is built and reused per (api_key, content_type).
 
         Args:
             api_key (str): The API key for Unsplash.
@@ -64,9 +71,12 @@ class UnsplashFactory:
 
 class PexelsFactory:
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_search_strategy(api_key: str, content_type: str):
         """
-        Returns the appropriate search strategy for Pexels based on the content type.
+        Returns the shared search strategy for Pexels based on the content type.
+
+        Strategies are stateless, so one instance is built and reused per (api_key, content_type).
 
         Args:
             api_key (str): The API key for Pexels.
@@ -1,172 +1,241 @@
+import asyncio
+import contextlib
+import logging
+import random
 import requests
-from abc import ABC, abstractmethod
 import requests.exceptions
 import aiohttp
-class SearchStrategy(ABC):
-    @abstractmethod
-    def search(self, query):
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds for requests, and the equivalent aiohttp budget.
+_SYNC_TIMEOUT = (3, 10)
+_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+# Rate-limit and transient server statuses retried by `asearch`; the sync path retries them in its HTTPAdapter.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_MAX_RETRY_AFTER = 10.0
+
+
+def _retry_delay(retry_after: str, attempt: int) -> float:
+    """
+    Return how long to wait before retrying a request.
+
+    Args:
+        retry_after (str): The Retry-After header of the response, if any.
+        attempt (int): The number of attempts made so far, minus one.
+
+    Returns:
+        float: The Retry-After delay in seconds (capped), or a jittered exponential backoff
+            when the header is missing or is not a number of seconds.
+    """
+    try:
+        return min(float(retry_after), _MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return 0.2 * 2 ** attempt + random.random() * 0.1
+
+class SearchStrategy:
+    """
+    The interface implemented by every search strategy.
+
+    A plain base class rather than an ABC, so constructing a strategy skips the ABCMeta checks.
+    """
+    __slots__ = ()
+
+    def search(self, query, session=None):
         """
-        Abstract method for searching media based on a query.
+        Search for media based on a query.
+
+        Subclasses must override this method.
 
         Args:
             query (str): The search query.
+            session (requests.Session, optional): A shared session to issue the request on.
 
         Returns:
             dict: The search results.
+
+        Raises:
+            NotImplementedError: If the subclass does not override this method.
         """
-        pass
+        raise NotImplementedError
 
-    def asearch(self, query):
+    def asearch(self, query, session=None, semaphore=None):
         """
-        Abstract method for asynchronously searching media based on a query.
+        Asynchronously search for media based on a query.
+
+        Subclasses must override this method.
 
         Args:
             query (str): The search query.
+            session (aiohttp.ClientSession, optional): A shared session to issue the request on.
+            semaphore (asyncio.Semaphore, optional): Limits how many requests are in flight at once.
 
         Returns:
             dict: The search results.
+
+        Raises:
+            NotImplementedError: If the subclass does not override this method.
         """
-        pass
+        raise NotImplementedError
 
 
-class PixabayImageSearchStrategy(SearchStrategy):
+def _no_auth(api_key: str) -> dict:
+    return {}
+
+
+def _client_id_auth(api_key: str) -> dict:
+    return {'Authorization': f'Client-ID {api_key}'}
+
+
+def _bare_key_auth(api_key: str) -> dict:
+    return {'Authorization': api_key}
+
+
+def _pixabay_params(template: tuple, params: dict) -> tuple:
+    return template + (('q', params.get('query')),)
+
+
+def _passthrough_params(template: tuple, params: dict) -> dict:
+    return params
+
+
+class HttpSearchStrategy(SearchStrategy):
     """
-    A search strategy for searching images using the Pixabay API.
+    A search strategy for searching media through a provider's HTTP search endpoint.
 
     Args:
-        api_key (str): The API key for accessing the Pixabay API.
+        api_key (str): The API key for accessing the API.
+        api_url (str): The URL of the search endpoint.
+        auth_fn (callable): Builds the request headers from the API key, once at construction.
+        param_fn (callable): Builds the query parameters from the parameter template and the search parameters.
+        key_param (str, optional): The query parameter carrying the API key, for providers that
+            authenticate through the query string. It is prebuilt into the parameter template.
     """
-    API_URL = 'https://pixabay.com/api/'
-
+    __slots__ = ('_api_key', '_api_url', '_headers', '_params_template', '_param_fn')
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, api_url: str, auth_fn=_no_auth, param_fn=_passthrough_params,
+                 key_param: str = None) -> None:
         self._api_key = api_key
+        self._api_url = api_url
+        self._headers = auth_fn(api_key)
+        self._params_template = ((key_param, api_key),) if key_param else ()
+        self._param_fn = param_fn
 
-    def search(self, query):
+    def search(self, params: dict, session: requests.Session = None):
         """
-        Search for images using the Pixabay API.
+        Search for media using the provider's API.
 
         Args:
-            query (str): The search query.
+            params (dict): The parameters for the search query.
+            session (requests.Session, optional): A shared session to issue the request on.
+                A short-lived session is created when omitted.
 
         Returns:
-            dict: The JSON response from the API.
-
-        Raises:
-            requests.HTTPError: If the API request fails.
+            dict: The JSON response from the API, or None if the request fails.
         """
-        params = {'key': self._api_key, 'q': query}
+        if session is None:
+            with requests.Session() as session:
+                return self.search(params, session)
+
+        query_params = self._param_fn(self._params_template, params)
         try:
-            response = requests.get(self.API_URL, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.HTTPError as e:
-            # Handle HTTP errors
-            print(f"HTTP Error: {e}")
+            # Stream so the body of an error response is never downloaded.
+            with session.get(self._api_url, params=query_params, headers=self._headers,
+                             timeout=_SYNC_TIMEOUT, stream=True) as response:
+                if not response.ok:
+                    logger.warning("HTTP Error: %s %s", response.status_code, response.reason)
+                    return None
+                return orjson.loads(response.content)
+        except requests.RequestException as e:
+            # Handle connection, timeout and retry errors
+            logger.warning("Request Error: %s", e)
             return None
         except Exception as e:
             # Handle any other exceptions
-            print(f"Error: {e}")
+            logger.warning("Error: %s", e)
             return None
-        
-    async def asearch(self, params: dict):
+
+    async def asearch(self, params: dict, session: aiohttp.ClientSession = None,
+                      semaphore: asyncio.Semaphore = None):
         """
-        Asynchronously search for images using the Pixabay API.
+        Asynchronously search for media using the provider's API.
+
+        Rate-limited (429) and transient 5xx responses are retried up to three times, honoring Retry-After.
 
         Args:
             params (dict): The parameters for the search query.
+            session (aiohttp.ClientSession, optional): A shared session to issue the request on.
+                A short-lived session is created when omitted.
+            semaphore (asyncio.Semaphore, optional): Limits how many requests are in flight at once.
+                A slot is held for each attempt, and released while backing off before a retry.
 
         Returns:
-            dict: The JSON response from the API.
-
-        Raises:
-            aiohttp.ClientError: If the API request fails.
+            dict: The JSON response from the API, or None if the request fails.
         """
-        query = params.get('query')
-        try:
+        if session is None:
             async with aiohttp.ClientSession() as session:
-                async with session.get(self.API_URL, params={'key': self._api_key, 'q': query}) as response:
-                    response.raise_for_status()
-                    return await response.json()
+                return await self.asearch(params, session, semaphore)
+
+        query_params = self._param_fn(self._params_template, params)
+        limit = semaphore if semaphore is not None else contextlib.nullcontext()
+        try:
+            for attempt in range(_MAX_RETRIES + 1):
+                async with limit, session.get(self._api_url, params=query_params, headers=self._headers,
+                                              timeout=_ASYNC_TIMEOUT) as response:
+                    if response.status in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+                        delay = _retry_delay(response.headers.get('Retry-After'), attempt)
+                        # Drain the body so the connection goes back to the pool instead of being closed.
+                        await response.read()
+                    elif response.status >= 400:
+                        # Skip reading the error body; the status is all the caller gets.
+                        logger.warning("HTTP Error: %s %s", response.status, response.reason)
+                        return None
+                    else:
+                        return orjson.loads(await response.read())
+                # Sleep after the response and semaphore slot are released, so neither is held while waiting.
+                await asyncio.sleep(delay)
         except aiohttp.ClientError as e:
             # Handle client errors
-            print(f"Client Error: {e}")
+            logger.warning("Client Error: %s", e)
             return None
         except Exception as e:
             # Handle any other exceptions
-            print(f"Error: {e}")
+            logger.warning("Error: %s", e)
             return None
 
-class PixabayVideoSearchStrategy(SearchStrategy):
+
+class PixabayImageSearchStrategy(HttpSearchStrategy):
     """
-    A search strategy for searching videos using the Pixabay API.
+    A search strategy for searching images using the Pixabay API.
 
     Args:
         api_key (str): The API key for accessing the Pixabay API.
     """
-    API_URL = 'https://pixabay.com/api/videos/'
-
+    API_URL = 'https://pixabay.com/api/'
+    __slots__ = ()
 
     def __init__(self, api_key: str) -> None:
-        self._api_key = api_key
+        super().__init__(api_key, self.API_URL, _no_auth, _pixabay_params, key_param='key')
 
-        
-    async def asearch(self, params: dict):
-        """
-        Asynchronously search for videos using the Pixabay API.
 
-        Args:
-            params (dict): The parameters for the search query.
-
-        Returns:
-            dict: The JSON response from the API.
-
-        Raises:
-            aiohttp.ClientError: If the API request fails.
-        """
-        query = params.get('query')
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.API_URL, params={'key': self._api_key, 'q': query}) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as e:
-            # Handle client errors
-            print(f"Client Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
-        
-    def search(self, query):
-        """
-        Search for videos using the Pixabay API.
+class PixabayVideoSearchStrategy(HttpSearchStrategy):
+    """
+    A search strategy for searching videos using the Pixabay API.
 
-        Args:
-            query (str): The search query.
+    Args:
+        api_key (str): The API key for accessing the Pixabay API.
+    """
+    API_URL = 'https://pixabay.com/api/videos/'
+    __slots__ = ()
 
-        Returns:
-            dict: The JSON response from the API.
+    def __init__(self, api_key: str) -> None:
+        super().__init__(api_key, self.API_URL, _no_auth, _pixabay_params, key_param='key')
 
-        Raises:
-            requests.HTTPError: If the API request fails.
-        """
-        params = {'key': self._api_key, 'q': query}
-        try:
-            response = requests.get(self.API_URL, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.HTTPError as e:
-            # Handle HTTP errors
-            print(f"HTTP Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
 
-class UnsplashImageSearchStrategy(SearchStrategy):
+class UnsplashImageSearchStrategy(HttpSearchStrategy):
     """
     A search strategy for searching images using the Unsplash API.
 
@@ -174,63 +243,11 @@ class UnsplashImageSearchStrategy(SearchStrategy):
         api_key (str): The API key for accessing the Unsplash API.
     """
     API_URL = 'https://api.unsplash.com/search/photos'
+    __slots__ = ()
 
     def __init__(self, api_key: str) -> None:
-        self._api_key = api_key
+        super().__init__(api_key, self.API_URL, _client_id_auth, _passthrough_params)
 
-    async def asearch(self, params: dict):
-        """
-        Search for images using the Unsplash API.
-
-        Args:
-            params (dict): The parameters for the search query.
-
-        Returns:
-            dict: The JSON response from the API.
-
-        Raises:
-            requests.HTTPError: If the API request fails.
-        """
-        headers = {'Authorization': f'Client-ID {self._api_key}'}
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.API_URL, params=params, headers=headers) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as e:
-            # Handle client errors
-            print(f"Client Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
-    def search(self, params: dict):
-        """
-        Search for images using the Unsplash API.
-
-        Args:
-            query (str): The search query.
-
-        Returns:
-            dict: The JSON response from the API.
-
-        Raises:
-            requests.HTTPError: If the API request fails.
-        """
-        headers = {'Authorization': f'Client-ID {self._api_key}'}
-        try:
-            response = requests.get(self.API_URL, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.HTTPError as e:
-            # Handle HTTP errors
-            print(f"HTTP Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
 
 class UnsplashVideoSearchStrategy(SearchStrategy):
     """
@@ -240,37 +257,44 @@ class UnsplashVideoSearchStrategy(SearchStrategy):
         api_key (str): The API key for accessing the Unsplash API.
     """
     API_URL = 'https://api.unsplash.com/search/videos'
+    __slots__ = ('_api_key',)
 
 
     def __init__(self, api_key: str) -> None:
         self._api_key = api_key
 
 
-    async def asearch(self, params: dict):
+    async def asearch(self, params: dict, session: aiohttp.ClientSession = None,
+                      semaphore: asyncio.Semaphore = None):
         """
         Search for videos using the Unsplash API.
 
         Args:
             params (dict): The parameters for the search query.
+            session (aiohttp.ClientSession, optional): A shared session to issue the request on.
+                A short-lived session is created when omitted.
+            semaphore (asyncio.Semaphore, optional): Limits how many requests are in flight at once.
 
         Returns:
             str: A message indicating that video search is not implemented yet.
         """
         return "Unsplash video search not implemented yet."
 
-    def search(self, params: dict):
+    def search(self, params: dict, session: requests.Session = None):
         """
         Search for videos using the Unsplash API.
 
         Args:
             query (str): The search query.
+            session (requests.Session, optional): A shared session to issue the request on.
 
         Returns:
             str: A message indicating that video search is not implemented yet.
         """
         return "Unsplash video search not implemented yet."
 
-class PexelsImageSearchStrategy(SearchStrategy):
+
+class PexelsImageSearchStrategy(HttpSearchStrategy):
     """
     A search strategy for searching images using the Pexels API.
 
@@ -278,68 +302,13 @@ class PexelsImageSearchStrategy(SearchStrategy):
         api_key (str): The API key for accessing the Pexels API.
     """
     API_URL = 'https://api.pexels.com/v1/search'
-
+    __slots__ = ()
 
     def __init__(self, api_key: str) -> None:
-        self._api_key = api_key
-
-    async def asearch(self, params: dict):
-        """
-        Search for images using the Pexels API.
-
-        Args:
-            params (dict): The parameters for the search query.
+        super().__init__(api_key, self.API_URL, _bare_key_auth, _passthrough_params)
 
-        Returns:
-            dict: The JSON response from the API.
 
-        Raises:
-            requests.HTTPError: If the API request fails.
-        """
-        headers = {'Authorization': self._api_key}
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.API_URL, params=params, headers=headers) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as e:
-            # Handle client errors
-            print(f"Client Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
-    
-    def search(self, params: dict):
-        """
-        Search for images using the Pexels API.
-
-        Args:
-            query (str): The search query.
-
-        Returns:
-            dict: The JSON response from the API.
-
-        Raises:
-            requests.HTTPError: If the API request fails.
-        """
-        headers = {'Authorization': self._api_key}
-        try:
-            response = requests.get(self.API_URL, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.HTTPError as e:
-            # Handle HTTP errors
-            print(f"HTTP Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
-        
-
-class PexelsVideoSearchStrategy(SearchStrategy):
+class PexelsVideoSearchStrategy(HttpSearchStrategy):
     """
     A search strategy for searching videos using the Pexels API.
 
@@ -347,66 +316,11 @@ class PexelsVideoSearchStrategy(SearchStrategy):
         api_key (str): The API key for accessing the Pexels API.
     """
     API_URL = 'https://api.pexels.com/videos/search'
-
+    __slots__ = ()
 
     def __init__(self, api_key: str) -> None:
-        self._api_key = api_key
-
-    async def asearch(self, params: dict):
-        """
-        Search for videos using the Pexels API.
-
-        Args:
-            params (dict): The parameters for the search query.
-
-        Returns:
-            dict: The JSON response from the API.
+        super().__init__(api_key, self.API_URL, _bare_key_auth, _passthrough_params)
 
-        Raises:
-            requests.HTTPError: If the API request fails.
-        """
-        headers = {'Authorization': self._api_key}
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.API_URL, params=params, headers=headers) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as e:
-            # Handle client errors
-            print(f"Client Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
-        
-    def search(self, params: dict):
-        """
-        Search for videos using the Pexels API.
-
-        Args:
-            query (str): The search query.
-
-        Returns:
-            dict: The JSON response from the API.
-
-        Raises:
-            requests.HTTPError: If the API request fails.
-        """
-        headers = {'Authorization': self._api_key}
-        try:
-            response = requests.get(self.API_URL, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.HTTPError as e:
-            # Handle HTTP errors
-            print(f"HTTP Error: {e}")
-            return None
-        except Exception as e:
-            # Handle any other exceptions
-            print(f"Error: {e}")
-            return None
-        
 
 class EngineBasedSearchStrategy(SearchStrategy):
     """
@@ -1,36 +1,37 @@
 from MediaSearcher import SearchClient
 import time
 from dotenv import load_dotenv
-import os
 
 load_dotenv()
 
-pixabay_params = {"provider":"pixabay","key":os.getenv("PIXABAY_KEY")}
-unsplash_params = {"provider":"unsplash","key":os.getenv("UNSPLASH_KEY")}
-pexels_params = {"provider":"pexels","key":os.getenv("PEXELS_KEY")}
+providers = ["pixabay","unsplash","pexels"]
 
 
 #test single client with asynchrously
 async def test_search():
     #search for images
-    for param in [pixabay_params,unsplash_params,pexels_params]:
+    for provider in providers:
         start_time = time.time()
-        search_cli = SearchClient(param)
+        search_cli = SearchClient.from_env(provider)
         params = {'query': 'cat'}
         images = await search_cli.asearch(params, 'hybrid')
-        print(f"⏰ Time taken for {param['provider']} asynchronous mode: ", time.time() - start_time, " seconds")
+        print(f"⏰ Time taken for {provider} asynchronous mode: ", time.time() - start_time, " seconds")
+    #close the shared sessions before the event loop goes away
+    for provider in providers:
+        await SearchClient.from_env(provider).aclose()
         
 
     
 #sync version
 def test_search_sync():
     #search for images
-    for param in [pixabay_params,unsplash_params,pexels_params]:
+    for provider in providers:
         start_time = time.time()
-        search_cli = SearchClient(param)
-        params = {'query': 'cat'}
+        search_cli = SearchClient.from_env(provider)
+        #different query, so the timing is not served from the async run's cache
+        params = {'query': 'dog'}
         images = search_cli.search(params, 'hybrid')
-        print(f"⏰ Time taken for {param['provider']} synchronous mode: ", time.time() - start_time, " seconds")
+        print(f"⏰ Time taken for {provider} synchronous mode: ", time.time() - start_time, " seconds")
 
 
 if __name__ == '__main__':
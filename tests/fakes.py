@@ -0,0 +1,113 @@
+"""
+Test doubles shared by the test modules.
+"""
+import asyncio
+
+from MediaSearcher import SearchClient
+
+
+class FakeStrategy:
+    """
+    A search strategy that counts its calls and returns a new result for each one.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    def search(self, params: dict, session=None):
+        self.calls += 1
+        return {'call': self.calls}
+
+    async def asearch(self, params: dict, session=None, semaphore=None):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.delay)
+        return {'call': call}
+
+
+def make_client(strategy: FakeStrategy, **params) -> SearchClient:
+    """
+    Return a Pixabay client whose image searches go to `strategy`.
+    """
+    client = SearchClient({'provider': 'pixabay', 'key': 'test', **params})
+    client._searchers['image'] = strategy
+    return client
+
+
+class FakeResponse:
+    def __init__(self, status: int, headers: dict = None, body: bytes = b'{"hits": []}') -> None:
+        self.status = status
+        self.reason = 'Fake'
+        self.headers = headers or {}
+        self._body = body
+        self.read_called = False
+
+    async def read(self) -> bytes:
+        self.read_called = True
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+class FakeSession:
+    """
+    An aiohttp-like session that returns the given responses in order.
+    """
+
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, **kwargs) -> FakeResponse:
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class FakeSyncResponse:
+    """
+    A requests-like response that records whether its body was read and whether it was closed.
+    """
+
+    def __init__(self, status_code: int, body: bytes = b'{"hits": []}') -> None:
+        self.status_code = status_code
+        self.reason = 'Fake'
+        self._body = body
+        self.content_read = False
+        self.closed = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        self.content_read = True
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.closed = True
+
+
+class FakeSyncSession:
+    """
+    A requests-like session that returns the given response, or raises the given exception,
+    and records the keyword arguments of each call.
+    """
+
+    def __init__(self, response) -> None:
+        self.response = response
+        self.kwargs = []
+
+    def get(self, url, **kwargs) -> FakeSyncResponse:
+        self.kwargs.append(kwargs)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
@@ -0,0 +1,38 @@
+import asyncio
+
+from fakes import make_client
+
+
+class EchoStrategy:
+    """
+    A search strategy that echoes the query back after sleeping for the query's 'delay'.
+    """
+
+    def __init__(self) -> None:
+        self.queries = []
+
+    async def asearch(self, params: dict, session=None, semaphore=None):
+        self.queries.append(params['query'])
+        await asyncio.sleep(params['delay'])
+        return {'query': params['query']}
+
+
+def test_asearch_many_preserves_order_and_dedups():
+    strategy = EchoStrategy()
+    queries = [
+        {'query': 'cat', 'delay': 0.03},
+        {'query': 'dog', 'delay': 0.01},
+        {'query': 'cat', 'delay': 0.03},
+        {'query': 'owl', 'delay': 0.0},
+    ]
+
+    async def main():
+        async with make_client(strategy) as client:
+            return await client.asearch_many(queries, 'image')
+
+    results = asyncio.run(main())
+    # Results follow the order of `queries`, not the order the searches finished in.
+    assert [result['query'] for result in results] == ['cat', 'dog', 'cat', 'owl']
+    # The duplicate 'cat' search shares the request already in flight.
+    assert sorted(strategy.queries) == ['cat', 'dog', 'owl']
+    assert results[0] is results[2]
@@ -0,0 +1,25 @@
+from fakes import FakeStrategy, make_client
+
+
+def test_cache_hit_and_miss():
+    strategy = FakeStrategy()
+    with make_client(strategy) as client:
+        first = client.search({'query': 'cat', 'per_page': 3}, 'image')
+        # Same parameters in a different order hit the cache.
+        assert client.search({'per_page': 3, 'query': 'cat'}, 'image') is first
+        assert strategy.calls == 1
+
+        assert client.search({'query': 'dog'}, 'image') == {'call': 2}
+        assert strategy.calls == 2
+
+
+def test_unhashable_params_are_cached():
+    strategy = FakeStrategy()
+    with make_client(strategy) as client:
+        # A list value makes the tuple key unhashable, so the repr-based key is used instead.
+        first = client.search({'query': 'cat', 'colors': ['red', 'blue']}, 'image')
+        assert client.search({'colors': ['red', 'blue'], 'query': 'cat'}, 'image') is first
+        assert strategy.calls == 1
+
+        assert client.search({'query': 'cat', 'colors': ['green']}, 'image') == {'call': 2}
+        assert strategy.calls == 2
@@ -0,0 +1,34 @@
+import asyncio
+
+from fakes import FakeStrategy, make_client
+
+
+def test_concurrent_identical_asearch_fetches_once():
+    strategy = FakeStrategy(delay=0.05)
+
+    async def main():
+        async with make_client(strategy) as client:
+            return await asyncio.gather(*(client.asearch({'query': 'cat'}, 'image') for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert strategy.calls == 1
+    assert results == [{'call': 1}] * 5
+
+
+def test_cancelled_waiter_does_not_cancel_other_callers():
+    strategy = FakeStrategy(delay=0.05)
+
+    async def main():
+        async with make_client(strategy) as client:
+            owner = asyncio.create_task(client.asearch({'query': 'cat'}, 'image'))
+            await asyncio.sleep(0)
+            cancelled = asyncio.create_task(client.asearch({'query': 'cat'}, 'image'))
+            waiter = asyncio.create_task(client.asearch({'query': 'cat'}, 'image'))
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            return await owner, await waiter, cancelled.cancelled()
+
+    owner_result, waiter_result, was_cancelled = asyncio.run(main())
+    assert was_cancelled
+    assert owner_result == waiter_result == {'call': 1}
+    assert strategy.calls == 1
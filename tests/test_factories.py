@@ -0,0 +1,26 @@
+import pytest
+
+from MediaSearcher import PexelsFactory, PixabayFactory, SearchClient, UnsplashFactory
+
+
+@pytest.mark.parametrize('factory', [PixabayFactory, UnsplashFactory, PexelsFactory])
+def test_factories_share_one_strategy_per_key_and_type(factory):
+    image = factory.get_search_strategy('key-a', 'image')
+    assert factory.get_search_strategy('key-a', 'image') is image
+    assert factory.get_search_strategy('key-b', 'image') is not image
+    assert factory.get_search_strategy('key-a', 'video') is not image
+
+
+def test_client_builds_strategies_lazily():
+    with SearchClient({'provider': 'pexels', 'key': 'lazy-key'}) as client:
+        assert client._searchers == {}
+
+        image = client._get_searcher('image')
+        assert list(client._searchers) == ['image']
+        assert image is PexelsFactory.get_search_strategy('lazy-key', 'image')
+
+        # Clients with the same key share the factory's strategies.
+        with SearchClient({'provider': 'pexels', 'key': 'lazy-key'}) as other:
+            assert other._get_searcher('image') is image
+
+        assert client._get_searcher('hybrid') is None
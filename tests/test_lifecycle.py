@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+import pytest
+
+import MediaSearcher.client as client_module
+from MediaSearcher import SearchClient
+
+from fakes import FakeStrategy, make_client
+
+
+def test_client_is_reusable_across_event_loops(caplog):
+    strategy = FakeStrategy()
+    client = make_client(strategy)
+
+    async def search(query: str):
+        result = await client.asearch({'query': query}, 'image')
+        return result, client._session, client._semaphore
+
+    # The first loop ends without aclose(), leaving its session open.
+    first, old_session, old_semaphore = asyncio.run(search('cat'))
+    with caplog.at_level(logging.WARNING, logger='MediaSearcher.client'):
+        second, new_session, new_semaphore = asyncio.run(search('dog'))
+
+    assert first == {'call': 1} and second == {'call': 2}
+    assert old_session.closed
+    assert new_session is not old_session
+    assert new_semaphore is not old_semaphore
+    assert 'closed event loop' in caplog.text
+
+    asyncio.run(client.aclose())
+    client.close()
+
+
+@pytest.mark.parametrize('provider', [None, 'flickr'])
+def test_from_env_rejects_unknown_provider(provider):
+    with pytest.raises(ValueError):
+        SearchClient.from_env(provider)
+
+
+def test_context_manager_does_not_close_shared_client(monkeypatch):
+    monkeypatch.setattr(client_module, '_CLIENTS', {})
+    monkeypatch.setenv('PIXABAY_KEY', 'test')
+    shared = SearchClient.from_env('pixabay')
+    shared._searchers['image'] = FakeStrategy()
+
+    async def main():
+        async with SearchClient.from_env('pixabay') as client:
+            await client.asearch({'query': 'cat'}, 'image')
+        # Another user of the shared client can still search after the block exits.
+        assert not shared._closed and not shared._session.closed
+        await shared.aclose()
+
+    asyncio.run(main())
+    assert SearchClient.from_env('pixabay') is shared
+    shared.close()
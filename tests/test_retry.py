@@ -0,0 +1,110 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import urllib3.util.retry as urllib3_retry
+
+from MediaSearcher import HttpSearchStrategy, PixabayImageSearchStrategy, SearchClient
+from MediaSearcher.strategies import strategy as strategy_module
+
+from fakes import FakeResponse, FakeSession
+
+
+def run_asearch(session: FakeSession, monkeypatch) -> tuple:
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(strategy_module.asyncio, 'sleep', fake_sleep)
+    strategy = PixabayImageSearchStrategy('test')
+    return asyncio.run(strategy.asearch({'query': 'cat'}, session)), delays
+
+
+def test_retry_honors_retry_after(monkeypatch):
+    session = FakeSession(FakeResponse(429, {'Retry-After': '2'}), FakeResponse(200))
+    result, delays = run_asearch(session, monkeypatch)
+    assert result == {'hits': []}
+    assert delays == [2.0]
+    assert session.calls == 2
+
+
+def test_retried_response_is_drained(monkeypatch):
+    rate_limited = FakeResponse(429, {'Retry-After': '0'}, body=b'{"error": "slow down"}')
+    run_asearch(FakeSession(rate_limited, FakeResponse(200)), monkeypatch)
+    assert rate_limited.read_called
+
+
+def test_retry_after_is_capped(monkeypatch):
+    session = FakeSession(FakeResponse(503, {'Retry-After': '3600'}), FakeResponse(200))
+    _, delays = run_asearch(session, monkeypatch)
+    assert delays == [strategy_module._MAX_RETRY_AFTER]
+
+
+def test_gives_up_after_max_retries(monkeypatch):
+    session = FakeSession(*(FakeResponse(429, {'Retry-After': '0'}) for _ in range(strategy_module._MAX_RETRIES + 1)))
+    result, delays = run_asearch(session, monkeypatch)
+    assert result is None
+    assert len(delays) == strategy_module._MAX_RETRIES
+    assert session.calls == strategy_module._MAX_RETRIES + 1
+
+
+def test_client_error_is_not_retried(monkeypatch):
+    session = FakeSession(FakeResponse(404))
+    result, delays = run_asearch(session, monkeypatch)
+    assert result is None
+    assert delays == []
+
+
+class RetryAfterHandler(BaseHTTPRequestHandler):
+    """
+    Answers the first request with a 429 and the server's Retry-After, and every later one with a 200.
+    """
+
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        if self.server.requests == 1:
+            self.send_response(429)
+            self.send_header('Retry-After', self.server.retry_after)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            body = b'{"hits": []}'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def run_search(retry_after: str, monkeypatch) -> tuple:
+    delays = []
+    monkeypatch.setattr(urllib3_retry.time, 'sleep', delays.append)
+
+    server = HTTPServer(('127.0.0.1', 0), RetryAfterHandler)
+    server.requests = 0
+    server.retry_after = retry_after
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        strategy = HttpSearchStrategy('test', f'http://127.0.0.1:{server.server_port}/')
+        with SearchClient._build_sync_session() as session:
+            result = strategy.search({'query': 'cat'}, session)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return result, delays
+
+
+def test_sync_retry_after_is_capped(monkeypatch):
+    result, delays = run_search('3600', monkeypatch)
+    assert result == {'hits': []}
+    assert delays == [strategy_module._MAX_RETRY_AFTER]
+
+
+def test_sync_retry_after_accepts_fractional_seconds(monkeypatch):
+    result, delays = run_search('0.01', monkeypatch)
+    assert result == {'hits': []}
+    assert delays == [0.01]
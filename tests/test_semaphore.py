@@ -0,0 +1,50 @@
+import asyncio
+
+from MediaSearcher import PixabayImageSearchStrategy, SearchClient
+from MediaSearcher.strategies import strategy as strategy_module
+
+from fakes import FakeResponse, FakeSession
+
+
+class ConcurrencyTrackingStrategy:
+    """
+    A search strategy that records the largest number of requests it ran at once.
+    """
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def asearch(self, params: dict, session=None, semaphore=None):
+        async with semaphore:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(0.01)
+            self.running -= 1
+        return {'query': params['query']}
+
+
+def test_max_inflight_caps_concurrent_requests():
+    strategy = ConcurrencyTrackingStrategy()
+
+    async def main():
+        async with SearchClient({'provider': 'pixabay', 'key': 'test', 'max_inflight': 2}) as client:
+            client._searchers['image'] = strategy
+            await asyncio.gather(*(client.asearch({'query': str(n)}, 'image') for n in range(10)))
+
+    asyncio.run(main())
+    assert strategy.peak == 2
+
+
+def test_semaphore_is_released_while_backing_off(monkeypatch):
+    semaphore = asyncio.Semaphore(1)
+    held_while_sleeping = []
+
+    async def fake_sleep(delay):
+        held_while_sleeping.append(semaphore.locked())
+
+    monkeypatch.setattr(strategy_module.asyncio, 'sleep', fake_sleep)
+    session = FakeSession(FakeResponse(429, {'Retry-After': '1'}), FakeResponse(200))
+    result = asyncio.run(PixabayImageSearchStrategy('test').asearch({'query': 'cat'}, session, semaphore))
+    assert result == {'hits': []}
+    assert held_while_sleeping == [False]
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from fakes import FakeStrategy, make_client
+
+
+def test_stale_hit_triggers_one_refresh():
+    strategy = FakeStrategy(delay=0.01)
+
+    async def main():
+        async with make_client(strategy, cache_ttl=0.01) as client:
+            assert await client.asearch({'query': 'cat'}, 'image') == {'call': 1}
+            await asyncio.sleep(0.02)
+
+            # Both stale hits return the old value immediately and share one background refresh.
+            stale = [await client.asearch({'query': 'cat'}, 'image') for _ in range(2)]
+            await asyncio.gather(*list(client._refresh_tasks))
+            return stale, await client.asearch({'query': 'cat'}, 'image')
+
+    stale, refreshed = asyncio.run(main())
+    assert stale == [{'call': 1}, {'call': 1}]
+    assert refreshed == {'call': 2}
+    assert strategy.calls == 2
+
+
+def test_aclose_waits_for_refreshes_and_stays_closed():
+    strategy = FakeStrategy(delay=0.05)
+
+    async def main():
+        client = make_client(strategy, cache_ttl=0)
+        await client.asearch({'query': 'cat'}, 'image')
+        # The stale hit starts a refresh that is still running when the client is closed.
+        await client.asearch({'query': 'cat'}, 'image')
+        tasks = list(client._refresh_tasks)
+        await client.aclose()
+        assert tasks and all(task.done() for task in tasks)
+
+        # A search needing a request must not open a new session on the closed client.
+        with pytest.raises(RuntimeError):
+            await client.asearch({'query': 'dog'}, 'image')
+        assert client._session is None
+        client.close()
+
+    asyncio.run(main())
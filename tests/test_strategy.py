@@ -0,0 +1,42 @@
+import asyncio
+
+import requests
+
+from MediaSearcher import PixabayImageSearchStrategy
+from MediaSearcher.strategies import strategy as strategy_module
+
+from fakes import FakeResponse, FakeSession, FakeSyncResponse, FakeSyncSession
+
+
+def test_sync_search_streams_and_decodes_response():
+    response = FakeSyncResponse(200, b'{"hits": [1, 2]}')
+    session = FakeSyncSession(response)
+
+    assert PixabayImageSearchStrategy('test').search({'query': 'cat'}, session=session) == {'hits': [1, 2]}
+    assert session.kwargs[0]['stream'] is True
+    assert session.kwargs[0]['timeout'] == strategy_module._SYNC_TIMEOUT
+    assert response.closed
+
+
+def test_sync_error_response_is_not_decoded():
+    response = FakeSyncResponse(404, b'not json')
+    session = FakeSyncSession(response)
+
+    assert PixabayImageSearchStrategy('test').search({'query': 'cat'}, session=session) is None
+    # The streamed error body is never downloaded, and the connection is released.
+    assert not response.content_read
+    assert response.closed
+
+
+def test_sync_request_error_returns_none():
+    session = FakeSyncSession(requests.ConnectionError('refused'))
+    assert PixabayImageSearchStrategy('test').search({'query': 'cat'}, session=session) is None
+
+
+def test_async_error_response_is_not_read():
+    response = FakeResponse(404, body=b'not json')
+    session = FakeSession(response)
+
+    result = asyncio.run(PixabayImageSearchStrategy('test').asearch({'query': 'cat'}, session=session))
+    assert result is None
+    assert not response.read_called